@@ -2,7 +2,7 @@
 
 from typing import Final
 
-SECURE_STRING_SUBSTITUTE = "this_value_is_encrypted"
+SECURE_STRING_SUBSTITUTE: Final[str] = "this_value_is_encrypted"
 
 # if duration is None (e.g. radio stream) = 48 hours
 FALLBACK_DURATION: Final[int] = 172800
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from typing import Any, TypeGuard
+from typing import Any, TypeGuard, TypeVar
 
-from mashumaro import DataClassDictMixin
+from mashumaro import field_options
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from music_assistant_models.enums import MediaType
 from music_assistant_models.errors import InvalidDataError
@@ -40,6 +41,7 @@ __all__ = [
     "Chapter",
     "ItemMapping",
     "Episode",
+    "MEDIA_ITEM_CLASSES",
     "MediaItem",
     "MediaItemMetadata",
     "ProviderMapping",
@@ -72,45 +74,93 @@ MediaItemType = (
     | BrowseFolder
 )
 
+# tuple of all MediaItemType classes, to be used for (fast) isinstance checks
+MEDIA_ITEM_CLASSES: tuple[type[MediaItem], ...] = (
+    Artist,
+    Album,
+    PlaylistTrack,
+    Track,
+    Radio,
+    Playlist,
+    Audiobook,
+    Chapter,
+    Podcast,
+    Episode,
+    BrowseFolder,
+)
+
+
+_MediaItemT = TypeVar("_MediaItemT", bound=MediaItem)
+
+
+def _media_items_deserializer(
+    item_cls: type[_MediaItemT],
+) -> Callable[[list[dict[str, Any]]], list[_MediaItemT | ItemMapping]]:
+    """Return deserializer for a list of (full) media items and/or ItemMappings."""
+    item_from_dict = item_cls.from_dict
+    mapping_from_dict = ItemMapping.from_dict
+
+    def _deserialize(items: list[dict[str, Any]]) -> list[_MediaItemT | ItemMapping]:
+        # pick the model directly instead of trying each member of the Union in turn
+        return [
+            item_from_dict(x) if "provider_mappings" in x else mapping_from_dict(x) for x in items
+        ]
+
+    return _deserialize
+
 
 @dataclass(kw_only=True)
-class SearchResults(DataClassDictMixin):
+class SearchResults(DataClassORJSONMixin):
     """Model for results from a search query."""
 
-    artists: Sequence[Artist | ItemMapping] = field(default_factory=list)
-    albums: Sequence[Album | ItemMapping] = field(default_factory=list)
-    tracks: Sequence[Track | ItemMapping] = field(default_factory=list)
-    playlists: Sequence[Playlist | ItemMapping] = field(default_factory=list)
-    radio: Sequence[Radio | ItemMapping] = field(default_factory=list)
-    audiobooks: Sequence[Audiobook | ItemMapping] = field(default_factory=list)
-    podcasts: Sequence[Podcast | ItemMapping] = field(default_factory=list)
+    artists: Sequence[Artist | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Artist))
+    )
+    albums: Sequence[Album | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Album))
+    )
+    tracks: Sequence[Track | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Track))
+    )
+    playlists: Sequence[Playlist | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Playlist))
+    )
+    radio: Sequence[Radio | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Radio))
+    )
+    audiobooks: Sequence[Audiobook | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Audiobook))
+    )
+    podcasts: Sequence[Podcast | ItemMapping] = field(
+        default=(), metadata=field_options(deserialize=_media_items_deserializer(Podcast))
+    )
+
+
+_MEDIA_TYPE_DISPATCH: dict[str, Callable[[dict[str, Any]], MediaItemType]] = {
+    "artist": Artist.from_dict,
+    "album": Album.from_dict,
+    "track": Track.from_dict,
+    "playlist": Playlist.from_dict,
+    "radio": Radio.from_dict,
+    "audiobook": Audiobook.from_dict,
+    "chapter": Chapter.from_dict,
+    "podcast": Podcast.from_dict,
+    "episode": Episode.from_dict,
+}
+_get_media_type_handler = _MEDIA_TYPE_DISPATCH.get
 
 
 def media_from_dict(media_item: dict[str, Any]) -> MediaItemType | ItemMapping:
     """Return MediaItem from dict."""
-    if "provider_mappings" not in media_item:
+    media_type = media_item.get("media_type")
+    if media_type is None or "provider_mappings" not in media_item:
         return ItemMapping.from_dict(media_item)
-    if media_item["media_type"] == "artist":
-        return Artist.from_dict(media_item)
-    if media_item["media_type"] == "album":
-        return Album.from_dict(media_item)
-    if media_item["media_type"] == "track":
-        return Track.from_dict(media_item)
-    if media_item["media_type"] == "playlist":
-        return Playlist.from_dict(media_item)
-    if media_item["media_type"] == "radio":
-        return Radio.from_dict(media_item)
-    if media_item["media_type"] == "audiobook":
-        return Audiobook.from_dict(media_item)
-    if media_item["media_type"] == "chapter":
-        return Chapter.from_dict(media_item)
-    if media_item["media_type"] == "podcast":
-        return Podcast.from_dict(media_item)
-    if media_item["media_type"] == "episode":
-        return Episode.from_dict(media_item)
-    raise InvalidDataError("Unknown media type")
+    handler = _get_media_type_handler(media_type)
+    if handler is None:
+        raise InvalidDataError("Unknown media type")
+    return handler(media_item)
 
 
 def is_track(val: MediaItem) -> TypeGuard[Track]:
     """Return true if this MediaItem is a track."""
-    return val.media_type == MediaType.TRACK
+    return val.media_type is MediaType.TRACK
@@ -3,17 +3,64 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 
-from mashumaro import DataClassDictMixin
+from mashumaro.config import BaseConfig, CodeGenerationOption
+from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from .enums import MediaType, PlayerFeature, PlayerState, PlayerType
 from .unique_list import UniqueList
 
+_time = time.time
 
-@dataclass(frozen=True)
-class DeviceInfo(DataClassDictMixin):
+# pool of interned feature sets, so players with the same features share a single instance
+# (only used for PlayerFeature values, a small fixed enum, so the pool stays small)
+_FEATURES_POOL: dict[frozenset[PlayerFeature], frozenset[PlayerFeature]] = {}
+
+
+def _intern_features(value: Iterable[PlayerFeature]) -> frozenset[PlayerFeature]:
+    """Return a shared frozenset instance equal to the given features."""
+    frozen = frozenset(value)
+    return _FEATURES_POOL.setdefault(frozen, frozen)
+
+
+class _FrozenSetField:
+    """Descriptor that wraps a field's slot to store assigned values as frozenset."""
+
+    __slots__ = ("_convert", "_slot")
+
+    def __init__(self, slot: Any, convert: Callable[[Iterable[Any]], frozenset[Any]]) -> None:
+        """Initialize."""
+        self._slot = slot
+        self._convert = convert
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        """Return the field value (or the descriptor itself on class access)."""
+        if obj is None:
+            return self
+        return self._slot.__get__(obj, objtype)
+
+    def __set__(self, obj: object, value: Iterable[Any]) -> None:
+        """Set the field value, converted to a frozenset."""
+        self._slot.__set__(obj, self._convert(value))
+
+
+class _OmitNoneConfig(BaseConfig):
+    """Mashumaro config that omits unset (None) values from the serialized payload."""
+
+    # consumers must treat a missing key as None,
+    # the full payload can be requested with to_dict(omit_none=False)
+    omit_none = True
+    # BaseConfig annotates this as an instance variable, hence the ignore
+    code_generation_options: ClassVar[list[CodeGenerationOption]] = [  # type: ignore[misc]
+        "TO_DICT_ADD_OMIT_NONE_FLAG"
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceInfo(DataClassORJSONMixin):
     """Model for a player's deviceinfo."""
 
     model: str = "Unknown model"
@@ -23,17 +70,20 @@ class DeviceInfo(DataClassDictMixin):
     manufacturer_id: str | None = None
     ip_address: str | None = None
     mac_address: str | None = None
+    # TEMP 2024-11-20: add alias to 'address' for ip_address for backwards compatibility
+    # Remove this in a future release
+    address: str = field(default="", init=False, repr=False, compare=False)
+
+    Config = _OmitNoneConfig
 
-    def __post_serialize__(self, d: dict[Any, Any]) -> dict[Any, Any]:
-        """Execute action(s) on serialization."""
-        # TEMP 2024-11-20: add alias to 'address' for ip_address for backwards compatibility
-        # Remove this in a future release
-        d["address"] = d.get("ip_address") or ""
-        return d
+    def __post_init__(self) -> None:
+        """Call after init."""
+        # precompute the alias once, so it is emitted by the generated serializer
+        object.__setattr__(self, "address", self.ip_address or "")
 
 
-@dataclass
-class PlayerMedia(DataClassDictMixin):
+@dataclass(slots=True)
+class PlayerMedia(DataClassORJSONMixin):
     """Metadata of Media loading/loaded into a player."""
 
     uri: str  # uri or other identifier of the loaded media
@@ -47,9 +97,11 @@ class PlayerMedia(DataClassDictMixin):
     queue_item_id: str | None = None  # only present for requests from queue controller
     custom_data: dict[str, Any] | None = None  # optional
 
+    Config = _OmitNoneConfig
+
 
-@dataclass(frozen=True)
-class PlayerSource(DataClassDictMixin):
+@dataclass(frozen=True, slots=True)
+class PlayerSource(DataClassORJSONMixin):
     """Model for a player source."""
 
     id: str
@@ -60,8 +112,20 @@ class PlayerSource(DataClassDictMixin):
     metadata: PlayerMedia | None = None
 
 
-@dataclass
-class Player(DataClassDictMixin):
+class _DeltaStateSlot:
+    """Base that adds a (non-field) slot for the last state sent by to_dict_delta."""
+
+    __slots__ = ("_last_delta_state",)
+
+    def _swap_delta_state(self, state: dict[str, Any]) -> dict[str, Any] | None:
+        """Store the given state and return the previously stored state (if any)."""
+        prev_state: dict[str, Any] | None = getattr(self, "_last_delta_state", None)
+        self._last_delta_state = state
+        return prev_state
+
+
+@dataclass(slots=True)
+class Player(_DeltaStateSlot, DataClassORJSONMixin):
     """Representation of a Player within Music Assistant."""
 
     player_id: str
@@ -71,7 +135,7 @@ class Player(DataClassDictMixin):
     available: bool
     powered: bool
     device_info: DeviceInfo
-    supported_features: set[PlayerFeature] = field(default_factory=set)
+    supported_features: frozenset[PlayerFeature] = field(default_factory=frozenset)
 
     state: PlayerState | None = None
     elapsed_time: float | None = None
@@ -89,7 +153,8 @@ class Player(DataClassDictMixin):
 
     # can_group_with: return set of player_id's this player can group/sync with
     # can also be instance id of an entire provider if all players can group with each other
-    can_group_with: set[str] = field(default_factory=set)
+    # NOTE: this is an immutable set, rebuild it to make changes (e.g. player.can_group_with | {id})
+    can_group_with: frozenset[str] = field(default_factory=frozenset)
 
     # synced_to: player_id of the player this player is currently synced to
     # also referred to as "sync leader"
@@ -163,23 +228,66 @@ class Player(DataClassDictMixin):
     # internal use only
     _prev_volume_level: int = 0
 
+    Config = _OmitNoneConfig
+
+    def to_dict_delta(self) -> dict[str, Any]:
+        """
+        Return dict with only the fields that changed since the last call.
+
+        Changes are detected by comparing against the serialized state of the previous call,
+        so in-place mutations (e.g. group_childs.append) are included as well.
+        The first call returns the full state. The player_id is always included.
+        Fields that changed to None are included with a None value.
+        NOTE: the previous state is kept on the player itself, so there must only be
+        a single caller (e.g. the broadcast loop) or callers will consume each other's deltas.
+        NOTE: nested (mutable) values within extra_data/custom_data are compared shallowly.
+        """
+        state = self.to_dict()
+        if (prev_state := self._swap_delta_state(state)) is None:
+            return dict(state)
+        delta: dict[str, Any] = {}
+        for key, value in state.items():
+            prev_value = prev_state.get(key)
+            if key in _PLAYER_SET_FIELDS and prev_value is not None:
+                # sets are serialized in (arbitrary) iteration order
+                if set(prev_value) != set(value):
+                    delta[key] = value
+            elif prev_value != value:
+                delta[key] = value
+        for key in prev_state.keys() - state.keys():
+            delta[key] = None
+        delta["player_id"] = self.player_id
+        return delta
+
     @property
     def corrected_elapsed_time(self) -> float | None:
         """Return the corrected/realtime elapsed time."""
-        if self.elapsed_time is None or self.elapsed_time_last_updated is None:
+        elapsed_time = self.elapsed_time
+        last_updated = self.elapsed_time_last_updated
+        if elapsed_time is None or last_updated is None:
             return None
-        if self.state == PlayerState.PLAYING:
-            return self.elapsed_time + (time.time() - self.elapsed_time_last_updated)
-        return self.elapsed_time
+        if self.state is not PlayerState.PLAYING:
+            return elapsed_time
+        return elapsed_time + (_time() - last_updated)
 
     @property
     def current_item_id(self) -> str | None:
         """Return current_item_id from current_media (if exists)."""
-        if self.current_media:
-            return self.current_media.uri
-        return None
+        current_media = self.current_media
+        return current_media.uri if current_media is not None else None
 
     @current_item_id.setter
     def current_item_id(self, uri: str) -> None:
         """Set current_item_id (for backwards compatibility)."""
         self.current_media = PlayerMedia(uri)
+
+
+_PLAYER_SET_FIELDS = frozenset(("supported_features", "can_group_with"))
+
+# enforce (interned) frozensets, also when these fields are reassigned after init
+for _name, _convert in (
+    ("supported_features", _intern_features),
+    ("can_group_with", frozenset),
+):
+    setattr(Player, _name, _FrozenSetField(Player.__dict__[_name], _convert))
+del _name, _convert
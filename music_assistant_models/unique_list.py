@@ -13,12 +13,9 @@ class UniqueList(list[_T]):
 
     def __init__(self, iterable: Iterable[_T] | None = None) -> None:
         """Initialize."""
-        if not iterable:
-            super().__init__()
-            return
-        seen: set[_T] = set()
-        seen_add = seen.add
-        super().__init__(x for x in iterable if not (x in seen or seen_add(x)))
+        super().__init__()
+        if iterable:
+            self.extend(iterable)
 
     def append(self, item: _T) -> None:
         """Append item."""
@@ -28,7 +25,20 @@ class UniqueList(list[_T]):
 
     def extend(self, other: Iterable[_T]) -> None:
         """Extend list."""
-        other = [x for x in other if x not in self]
+        other = list(other)
+        try:
+            # hashed membership checks (against a fresh snapshot) keep bulk updates linear,
+            # no index is kept between calls as (hashable) items may be mutated
+            seen = set(self)
+            seen_add = seen.add
+            other = [x for x in other if not (x in seen or seen_add(x))]
+        except TypeError:
+            # unhashable items, fall back to (slower) equality checks
+            unique: list[_T] = []
+            for x in other:
+                if x not in self and x not in unique:
+                    unique.append(x)
+            other = unique
         super().extend(other)
 
     def set(self, items: Iterable[_T]) -> None:
@@ -0,0 +1,67 @@
+"""Tests for the (shared) media item models."""
+
+import pytest
+from mashumaro.config import BaseConfig
+
+from music_assistant_models.errors import InvalidDataError
+from music_assistant_models.media_items import (
+    MEDIA_ITEM_CLASSES,
+    Artist,
+    ItemMapping,
+    MediaItemType,
+    SearchResults,
+    Track,
+    media_from_dict,
+)
+
+
+def test_media_from_dict() -> None:
+    """Test media_from_dict helper."""
+    base = {"item_id": "1", "provider": "library", "name": "Test"}
+    item = media_from_dict({**base, "media_type": "artist", "provider_mappings": []})
+    assert isinstance(item, Artist)
+    item = media_from_dict({**base, "media_type": "track", "provider_mappings": []})
+    assert isinstance(item, Track)
+    item = media_from_dict({**base, "media_type": "track"})
+    assert isinstance(item, ItemMapping)
+    item = media_from_dict({**base, "provider_mappings": []})
+    assert isinstance(item, ItemMapping)
+    with pytest.raises(InvalidDataError):
+        media_from_dict({**base, "media_type": "unknown", "provider_mappings": []})
+
+
+def test_media_item_classes() -> None:
+    """Test MEDIA_ITEM_CLASSES matches the MediaItemType union."""
+    assert set(MEDIA_ITEM_CLASSES) == set(MediaItemType.__args__)
+
+
+def test_search_results_serializers_not_lazy_compiled() -> None:
+    """Test lazy compilation of the SearchResults (de)serializers is not enabled."""
+    # same lookup as mashumaro uses to resolve the config of a class
+    assert getattr(SearchResults, "Config", BaseConfig).lazy_compilation is False
+
+
+def test_search_results_defaults() -> None:
+    """Test (de)serializing empty SearchResults."""
+    results = SearchResults()
+    assert results.artists == ()
+    assert results.to_dict()["artists"] == []
+    restored = SearchResults.from_json(SearchResults(tracks=[]).to_jsonb())
+    assert list(restored.tracks) == []
+
+
+def test_search_results_from_dict() -> None:
+    """Test deserializing SearchResults with both full items and ItemMappings."""
+    base = {"item_id": "1", "provider": "library", "name": "Test"}
+    results = SearchResults.from_dict(
+        {
+            "artists": [
+                {**base, "media_type": "artist", "provider_mappings": []},
+                {**base, "item_id": "2", "media_type": "artist"},
+            ]
+        }
+    )
+    assert isinstance(results.artists[0], Artist)
+    assert isinstance(results.artists[1], ItemMapping)
+    restored = SearchResults.from_json(results.to_jsonb())
+    assert [type(x) for x in restored.artists] == [Artist, ItemMapping]
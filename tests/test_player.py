@@ -0,0 +1,196 @@
+"""Tests for the Player model(s)."""
+
+import copy
+import dataclasses
+import itertools
+import pickle
+import time
+
+import pytest
+from mashumaro.config import BaseConfig
+
+from music_assistant_models.enums import PlayerFeature, PlayerState, PlayerType
+from music_assistant_models.player import DeviceInfo, Player, PlayerMedia, PlayerSource
+
+
+def _create_player() -> Player:
+    """Create a basic Player instance."""
+    return Player(
+        player_id="test",
+        provider="test_provider",
+        type=PlayerType.PLAYER,
+        name="Test Player",
+        available=True,
+        powered=False,
+        device_info=DeviceInfo(ip_address="127.0.0.1"),
+    )
+
+
+def test_player_json_roundtrip() -> None:
+    """Test (de)serializing a Player to/from JSON."""
+    player = _create_player()
+    restored = Player.from_json(player.to_jsonb())
+    assert restored == player
+    assert restored.device_info.ip_address == "127.0.0.1"
+
+
+def test_player_serialize_omits_none() -> None:
+    """Test that unset optional fields are omitted from the serialized Player."""
+    player = _create_player()
+    data = player.to_dict()
+    assert "state" not in data
+    assert "current_media" not in data
+    assert "software_version" not in data["device_info"]
+    assert player.to_dict(omit_none=False)["state"] is None
+    assert Player.from_dict(data) == player
+
+
+def test_player_corrected_elapsed_time() -> None:
+    """Test the corrected_elapsed_time property."""
+    player = _create_player()
+    assert player.corrected_elapsed_time is None
+    player.elapsed_time = 10
+    assert player.corrected_elapsed_time is None
+    player.elapsed_time_last_updated = time.time() - 5
+    assert player.corrected_elapsed_time == 10
+    player.state = PlayerState.PLAYING
+    corrected = player.corrected_elapsed_time
+    assert corrected is not None
+    assert 15 <= corrected < 20
+
+
+def test_device_info_address_alias() -> None:
+    """Test the (backwards compatible) address alias of DeviceInfo."""
+    assert DeviceInfo(ip_address="127.0.0.1").to_dict()["address"] == "127.0.0.1"
+    assert DeviceInfo().to_dict()["address"] == ""
+    restored = DeviceInfo.from_dict({"ip_address": "127.0.0.1", "address": "127.0.0.1"})
+    assert restored == DeviceInfo(ip_address="127.0.0.1")
+
+
+def test_player_serializers_not_lazy_compiled() -> None:
+    """Test lazy compilation of the mashumaro (de)serializers is not enabled."""
+    for cls in (Player, PlayerMedia, DeviceInfo, PlayerSource):
+        # same lookup as mashumaro uses to resolve the config of a class
+        assert getattr(cls, "Config", BaseConfig).lazy_compilation is False
+
+
+def test_player_features_are_interned() -> None:
+    """Test that equal supported_features of different players share one instance."""
+    player1 = _create_player()
+    player2 = _create_player()
+    player1 = Player.from_dict({**player1.to_dict(), "supported_features": ["power", "pause"]})
+    player2 = Player.from_dict({**player2.to_dict(), "supported_features": ["pause", "power"]})
+    assert player1.supported_features == frozenset({PlayerFeature.POWER, PlayerFeature.PAUSE})
+    assert player1.supported_features is player2.supported_features
+    assert isinstance(player1.can_group_with, frozenset)
+
+
+def test_player_frozenset_fields_reassigned() -> None:
+    """Test that reassigned set fields are still stored as (interned) frozensets."""
+    player1 = _create_player()
+    player2 = _create_player()
+    player1.supported_features = {PlayerFeature.PAUSE}  # type: ignore[assignment]
+    player2.supported_features = [PlayerFeature.PAUSE]  # type: ignore[assignment]
+    assert type(player1.supported_features) is frozenset
+    assert player1.supported_features is player2.supported_features
+    player1.can_group_with = {"a", "b"}  # type: ignore[assignment]
+    assert player1.can_group_with == frozenset({"a", "b"})
+    assert type(player1.can_group_with) is frozenset
+
+
+def test_player_current_item_id() -> None:
+    """Test the (backwards compatible) current_item_id property."""
+    player = _create_player()
+    assert player.current_item_id is None
+    player.current_item_id = "library://track/1"
+    assert player.current_media == PlayerMedia(uri="library://track/1")
+    assert player.current_item_id == "library://track/1"
+
+
+def test_player_to_dict_delta() -> None:
+    """Test serializing only the changed fields of a Player."""
+    player = _create_player()
+    assert player.to_dict_delta() == player.to_dict()
+    assert player.to_dict_delta() == {"player_id": "test"}
+    assert "_last_delta_state" not in player.to_dict()
+    assert "_last_delta_state" not in {x.name for x in dataclasses.fields(player)}
+    assert "_last_delta_state" not in dataclasses.asdict(player)
+    player.powered = True
+    player.volume_level = 50
+    player.state = PlayerState.PLAYING
+    assert player.to_dict_delta() == {
+        "player_id": "test",
+        "powered": True,
+        "volume_level": 50,
+        "state": "playing",
+    }
+    assert player.to_dict_delta() == {"player_id": "test"}
+    player.state = None
+    assert player.to_dict_delta() == {"player_id": "test", "state": None}
+
+
+def test_player_to_dict_delta_in_place_changes() -> None:
+    """Test in-place mutations are included in the Player delta."""
+    player = _create_player()
+    player.to_dict_delta()
+    player.group_childs.append("child")
+    player.source_list.append(PlayerSource(id="1", name="Source"))
+    player.extra_data["key"] = "value"
+    delta = player.to_dict_delta()
+    assert delta["group_childs"] == ["child"]
+    assert delta["source_list"][0]["id"] == "1"
+    assert delta["extra_data"] == {"key": "value"}
+    player.group_childs.set(["other"])
+    assert player.to_dict_delta() == {"player_id": "test", "group_childs": ["other"]}
+
+
+def test_player_to_dict_delta_set_order() -> None:
+    """Test set fields serialized in a different order are not reported as changed."""
+    player = _create_player()
+    player.can_group_with = frozenset(["a", "b", "c", "d", "e"])
+    player.to_dict_delta()
+    for ids in itertools.permutations(["a", "b", "c", "d", "e"]):
+        player.can_group_with = frozenset(ids)
+        assert player.to_dict_delta() == {"player_id": "test"}
+    # serialized set order depends on the hash seed, so build colliding orders explicitly
+    player.to_dict_delta()
+    player._last_delta_state["can_group_with"].reverse()  # noqa: SLF001
+    assert player.to_dict_delta() == {"player_id": "test"}
+    player.can_group_with = frozenset(["a"])
+    assert player.to_dict_delta() == {"player_id": "test", "can_group_with": ["a"]}
+
+
+def test_player_to_dict_delta_nested_omit_none() -> None:
+    """Test nested values in the Player delta omit None values."""
+    player = _create_player()
+    player.to_dict_delta()
+    player.current_media = PlayerMedia(uri="library://track/1")
+    assert player.to_dict_delta()["current_media"] == {
+        "uri": "library://track/1",
+        "media_type": "unknown",
+    }
+
+
+def test_player_to_dict_delta_copy() -> None:
+    """Test a copied Player does not share its delta state with the original."""
+    player = _create_player()
+    player.to_dict_delta()
+    player_copy = copy.copy(player)
+    player_copy.powered = True
+    assert player_copy.to_dict_delta() == {"player_id": "test", "powered": True}
+    assert player.to_dict_delta() == {"player_id": "test"}
+
+
+def test_player_models_are_slotted() -> None:
+    """Test the Player models use slots (and still copy/pickle correctly)."""
+    player = _create_player()
+    player.current_media = PlayerMedia(uri="library://track/1")
+    player.source_list.append(PlayerSource(id="1", name="Source"))
+    for obj in (player, player.device_info, player.current_media, player.source_list[0]):
+        assert not hasattr(obj, "__dict__")
+    with pytest.raises(AttributeError):
+        player.unknown_attribute = True  # type: ignore[attr-defined]
+    for restored in (copy.deepcopy(player), pickle.loads(pickle.dumps(player))):  # noqa: S301
+        assert restored == player
+        assert restored.device_info.address == "127.0.0.1"
+        assert type(restored.can_group_with) is frozenset
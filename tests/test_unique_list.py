@@ -0,0 +1,57 @@
+"""Tests for the UniqueList helper."""
+
+import copy
+
+from music_assistant_models.enums import MediaType
+from music_assistant_models.media_items import ItemMapping
+from music_assistant_models.player import PlayerMedia, PlayerSource
+from music_assistant_models.unique_list import UniqueList
+
+
+def test_unique_list() -> None:
+    """Test UniqueList keeps items unique and ordered."""
+    items = UniqueList(["a", "b", "a"])
+    assert items == ["a", "b"]
+    items.append("b")
+    items.append("c")
+    assert items == ["a", "b", "c"]
+    items.extend(["d", "a", "d", "e"])
+    assert items == ["a", "b", "c", "d", "e"]
+    items.set(["e", "e", "f"])
+    assert items == ["e", "f"]
+
+
+def test_unique_list_unhashable() -> None:
+    """Test UniqueList with unhashable items."""
+    source = PlayerSource(id="1", name="Source", metadata=PlayerMedia(uri="test"))
+    items: UniqueList[PlayerSource] = UniqueList()
+    items.extend([source, source])
+    items.append(source)
+    assert items == [source]
+    items = UniqueList([source, source])
+    items.append(PlayerSource(id="2", name="Other"))
+    assert len(items) == 2
+
+
+def test_unique_list_mutated_item() -> None:
+    """Test UniqueList with a (hashable) item that is mutated after insertion."""
+    artist = ItemMapping(item_id="1", provider="spotify", name="A", media_type=MediaType.ARTIST)
+    items = UniqueList([artist])
+    artist.uri = "library://artist/5"
+    other = ItemMapping(item_id="5", provider="library", name="A", media_type=MediaType.ARTIST)
+    assert other.uri == "library://artist/5"
+    items.append(other)
+    assert len(items) == 1
+    items.extend([other])
+    assert len(items) == 1
+
+
+def test_unique_list_copy() -> None:
+    """Test copying a UniqueList keeps both lists independent."""
+    items = UniqueList(["a", "b"])
+    items_copy = copy.copy(items)
+    assert isinstance(items_copy, UniqueList)
+    items_copy.append("c")
+    items.append("c")
+    assert items == items_copy == ["a", "b", "c"]
+    assert copy.deepcopy(items) == ["a", "b", "c"]